@@ -1,12 +1,34 @@
+import errno
+import io
 import os
 import sys
 import json
+import logging
+import logging.handlers
+import queue
 import shutil
+import signal
+import struct
+import threading
 import time
+import zipfile
+import xml.etree.ElementTree as ET
+from json.encoder import encode_basestring as _q
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from pygltflib import GLTF2
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 try:
     import openpyxl
@@ -14,9 +36,30 @@ try:
 except ImportError:
     openpyxl = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Watcher messages go through a queue so event/worker threads never block on
+# console output; watch() starts the listener that prints them
+log = logging.getLogger("watcher")
+
 # Supported file extensions
-IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
-VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+# Reserved per-part asset folders (everything else under ModelParts is a sub-part)
+PART_ASSET_FOLDERS = frozenset({"Button_Images", "Video", "Description"})
+# Every extension the watcher reacts to, mapped to its kind of file
+EXT_KIND = {e: 'image' for e in IMAGE_EXTENSIONS} | {e: 'video' for e in VIDEO_EXTENSIONS} | {
+    '.xlsx': 'excel', '.glb': 'model', '.bat': 'script'}
+# Hidden/editor lock files and partial downloads never trigger work
+_IGNORED_PREFIXES = ('.', '~$')
+_IGNORED_SUFFIXES = ('.crdownload', '.tmp', '.part')
+# Threads used to scan sibling part folders concurrently
+SCAN_WORKERS = 8
+# Threads used to create part folders and Excel files
+CREATE_WORKERS = 16
 
 # ============================================================================
 # GLB HIERARCHY
@@ -27,26 +70,43 @@ VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
 # ============================================================================
 
 def extract_hierarchy(glb_path):
-    """Extract hierarchical structure from a GLB file."""
+    """Extract hierarchical structure from a GLB file.
+
+    Only the GLB header and JSON chunk are read; the binary buffer chunk
+    (meshes, textures) is never loaded.
+    """
     try:
-        gltf = GLTF2().load(glb_path)
+        with open(glb_path, 'rb') as f:
+            magic, _version, _length = struct.unpack('<4sII', f.read(12))
+            chunk_len, chunk_type = struct.unpack('<I4s', f.read(8))
+            if magic != b'glTF' or chunk_type != b'JSON':
+                raise ValueError("not a binary glTF file")
+            gltf = json.loads(f.read(chunk_len))
         nodes_dict = {}
-        if gltf.nodes:
-            for idx, node in enumerate(gltf.nodes):
-                node_name = node.name if node.name else f"Node_{idx}"
-                nodes_dict[idx] = {'name': node_name, 'children': node.children or []}
+        for idx, node in enumerate(gltf.get('nodes') or []):
+            node_name = node.get('name') or f"Node_{idx}"
+            nodes_dict[idx] = {'name': node_name, 'children': node.get('children') or []}
         
         all_children = set()
         for n in nodes_dict.values(): all_children.update(n['children'])
         root_nodes = [i for i in nodes_dict if i not in all_children]
         
-        def build(idx):
-            if idx not in nodes_dict: return None
+        # Iterative post-order build: list reachable nodes parents-first, then
+        # build them in reverse so every child dict exists before its parent.
+        # The seen set also keeps malformed (cyclic) node graphs finite.
+        order, seen, stack = [], set(), list(reversed(root_nodes))
+        while stack:
+            idx = stack.pop()
+            if idx in seen or idx not in nodes_dict: continue
+            seen.add(idx)
+            order.append(idx)
+            stack.extend(reversed(nodes_dict[idx]['children']))
+        built = {}
+        for idx in reversed(order):
             node = nodes_dict[idx]
-            children = [c for c in (build(child) for child in node['children']) if c]
-            return {
+            built[idx] = {
                 'name': node['name'],
-                'children': children
+                'children': [built[c] for c in node['children'] if c in built]
             }
         
         hierarchy = []
@@ -55,12 +115,12 @@ def extract_hierarchy(glb_path):
             # Heuristic: If there is only 1 root node, treat it as the "Container" and use its children.
             # If there are multiple roots, they are likely sibling parts.
             if len(root_nodes) == 1:
-                root_tree = build(root)
+                root_tree = built.get(root)
                 if root_tree and root_tree['children']:
                     hierarchy.extend(root_tree['children'])
                 # If root has no children, return empty hierarchy (no parts)
             else:
-                tree = build(root)
+                tree = built.get(root)
                 if tree and tree['name'].strip(): hierarchy.append(tree)
                 
         return hierarchy
@@ -69,45 +129,54 @@ def extract_hierarchy(glb_path):
         return []
 
 def create_folders_from_hierarchy(hierarchy, parent_folder):
-    """Recursively create ModelParts folders."""
-    created = []
-    for node in hierarchy:
+    """Create ModelParts folders for every node of the hierarchy.
+
+    The tree is flattened into a list of directories and Excel targets first,
+    then both are created on a thread pool (mkdir and small file writes are
+    latency bound, not CPU bound).
+    """
+    created, dirs, excels = [], [], []
+    stack = [(node, parent_folder) for node in reversed(hierarchy)]
+    while stack:
+        node, parent = stack.pop()
         name = node['name']
         if not name.strip(): continue
         
-        # Create folder for part
-        part_folder = parent_folder / name
-        part_folder.mkdir(exist_ok=True)
+        part_folder = parent / name
         created.append(part_folder)
-        print(f"✔️  Created part: {part_folder}")
-        
-        # Subfolders
-        (part_folder / "Button_Images").mkdir(exist_ok=True)
-        (part_folder / "Video").mkdir(exist_ok=True)
         desc_folder = part_folder / "Description"
-        desc_folder.mkdir(exist_ok=True)
-        
-        # Excel
-        create_excel(desc_folder, f"DescriptionFor{name}")
-        
-        # Children
-        if node['children']:
-            created.extend(create_folders_from_hierarchy(node['children'], part_folder))
+        dirs += [part_folder / "Button_Images", part_folder / "Video", desc_folder]
+        excels.append((desc_folder, f"DescriptionFor{name}"))
+        stack.extend((child, part_folder) for child in reversed(node['children']))
+    
+    with ThreadPoolExecutor(max_workers=CREATE_WORKERS) as ex:
+        list(ex.map(lambda d: os.makedirs(d, exist_ok=True), dirs))
+        list(ex.map(lambda t: create_excel(*t), excels))
+    for part_folder in created:
+        print(f"✔️  Created part: {part_folder}")
     return created
 
+@lru_cache(maxsize=1)
+def _excel_template():
+    """Bytes of the empty Key/Value description workbook, serialized once."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Description"
+    ws['A1'], ws['B1'] = "Key", "Value"
+    ws['A1'].font = ws['B1'].font = Font(bold=True)
+    ws.column_dimensions['A'].width = 20
+    ws.column_dimensions['B'].width = 40
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
 def create_excel(folder, name):
     if not openpyxl: return
     path = folder / f"{name}.xlsx"
     if path.exists(): return
     try:
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Description"
-        ws['A1'], ws['B1'] = "Key", "Value"
-        ws['A1'].font = ws['B1'].font = Font(bold=True)
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 40
-        wb.save(path)
+        # Every description workbook starts identical, so copy the template
+        path.write_bytes(_excel_template())
         print(f"✔️  Created Excel: {path}")
     except Exception as e:
         print(f"❌ Error creating Excel: {e}")
@@ -117,79 +186,306 @@ def create_excel(folder, name):
 # DATA GENERATION
 # ============================================================================
 
+def _ext(name):
+    """Lower-cased extension of a file name ('' for none or dotfiles), like Path.suffix."""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ""
+
+@lru_cache(maxsize=4096)
+def _scan(path_str):
+    """List a directory once per generate_json run as (name, path, is_dir, is_file) tuples.
+
+    The cache is cleared at the end of every generate_json call, so it only
+    dedupes listings within a single regeneration.
+    """
+    with os.scandir(path_str) as it:
+        return tuple((e.name, e.path, e.is_dir(), e.is_file()) for e in it)
+
+def _rel_posix(base_str, full_str):
+    """full_str relative to base_str (a folder path ending in os.sep), '/'-separated."""
+    rel = full_str[len(base_str):]
+    return rel.replace(os.sep, '/') if os.sep != '/' else rel
+
+def _images_in(img_folder, base_str):
+    """base_str is the base folder path ending in os.sep; paths are sliced off it."""
+    buttons = []
+    for name, full, _, is_file in _scan(os.fspath(img_folder)):
+        if not is_file: continue
+        dot = name.rfind('.')
+        if dot <= 0 or name[dot:].lower() not in IMAGE_EXTENSIONS: continue
+        if not full.startswith(base_str):
+            print(f"⚠️ Path error: {full} is not relative to {base_str}")
+            continue
+        buttons.append({
+            "name": name[:dot],
+            "imagePath": _rel_posix(base_str, full)
+        })
+    buttons.sort(key=lambda x: x['name'])
+    return buttons
+
+def _video_in(vid_folder, base_str):
+    for name, full, _, is_file in _scan(os.fspath(vid_folder)):
+        if is_file and _ext(name) in VIDEO_EXTENSIONS and full.startswith(base_str):
+            return _rel_posix(base_str, full)
+    return ""
+
+def _desc_in(desc_folder):
+    for name, full, _, is_file in _scan(os.fspath(desc_folder)):
+        if is_file and not name.startswith('~$') and name.lower().endswith('.xlsx'):
+            return read_excel_file(full)
+    return []
+
 def scan_images(folder, base):
     """Scan Button_Images folder."""
-    buttons = []
     img_folder = folder / "Button_Images"
     # print(f"  Scanning images in: {img_folder}") # Debug
-    if img_folder.exists():
-        for f in img_folder.iterdir():
-            if f.suffix.lower() in IMAGE_EXTENSIONS:
-                try:
-                    rel = f.relative_to(base)
-                    buttons.append({
-                        "name": f.stem,
-                        "imagePath": str(rel).replace('\\', '/')
-                    })
-                except ValueError:
-                    print(f"⚠️ Path error: {f} is not relative to {base}")
-                    
-    buttons.sort(key=lambda x: x['name'])
-    return buttons
+    return _images_in(img_folder, os.path.join(base, '')) if img_folder.exists() else []
 
 def scan_video(folder, base):
     """Scan Video folder."""
     vid_folder = folder / "Video"
-    if vid_folder.exists():
-        for f in vid_folder.iterdir():
-            if f.suffix.lower() in VIDEO_EXTENSIONS:
-                try:
-                    return str(f.relative_to(base)).replace('\\', '/')
-                except ValueError: pass
-    return ""
+    return _video_in(vid_folder, os.path.join(base, '')) if vid_folder.exists() else ""
+
+_XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+# Built-in number formats that display a date or time
+_XLSX_DATE_FMTS = frozenset(range(14, 23)) | frozenset(range(27, 37)) | frozenset(range(45, 48)) | frozenset(range(50, 59))
+
+def _xlsx_text(el):
+    """Text of a <si>/<is> string: plain and rich-text runs, without the
+    phonetic (<rPh>) readings Excel stores next to IME-typed text."""
+    parts = []
+    for child in el:
+        if child.tag == _XLSX_NS + 'r': child = child.find(_XLSX_NS + 't')
+        elif child.tag != _XLSX_NS + 't': continue
+        if child is not None: parts.append(child.text or '')
+    return ''.join(parts)
+
+def _xlsx_value(cell, shared):
+    """Python value of a sheet <c> element, matching what openpyxl returns.
+
+    Raises ValueError for an ISO date cell (t="d"), left to openpyxl.
+    """
+    t = cell.get('t', 'n')
+    if t == 'inlineStr':
+        el = cell.find(_XLSX_NS + 'is')
+        return _xlsx_text(el) if el is not None else None
+    v = cell.findtext(_XLSX_NS + 'v')
+    if not v: return None
+    if t == 'd': raise ValueError("date cell")
+    if t == 's': return shared[int(v)]
+    if t == 'b': return v == '1'
+    if t == 'n':
+        try: return int(v)
+        except ValueError: return float(v)
+    return v
+
+def _is_date_format(code):
+    # Drop quoted text, escapes and [colour]/[$-locale] sections, then look
+    # for date/time placeholders (same idea as openpyxl's is_date_format)
+    out, i = [], 0
+    while i < len(code):
+        ch = code[i]
+        if ch == '"':
+            i = code.find('"', i + 1)
+            if i < 0: break
+        elif ch == '\\':
+            i += 1
+        elif ch == '[':
+            j = code.find(']', i)
+            if j < 0: break
+            if code[i + 1:j].lower().strip('hms'): i = j # keep [h]/[mm]/[ss]
+            else: out.append(code[i + 1:j])
+        else:
+            out.append(ch)
+        i += 1
+    return any(c in 'dmyhs' for c in ''.join(out).lower())
+
+def _xlsx_date_styles(z):
+    """Indices of cell styles (the c/@s attribute) that format a date."""
+    if 'xl/styles.xml' not in z.namelist(): return frozenset()
+    root = ET.fromstring(z.read('xl/styles.xml'))
+    custom = {int(f.get('numFmtId')): f.get('formatCode', '')
+              for f in root.iter(_XLSX_NS + 'numFmt')}
+    xfs = root.find(_XLSX_NS + 'cellXfs')
+    dates = set()
+    for i, xf in enumerate(xfs if xfs is not None else ()):
+        fmt = int(xf.get('numFmtId', 0))
+        if fmt in custom: is_date = _is_date_format(custom[fmt])
+        else: is_date = fmt in _XLSX_DATE_FMTS
+        if is_date: dates.add(i)
+    return dates
+
+def _xlsx_active_sheet(z):
+    """Zip path of the workbook's active sheet (what openpyxl's wb.active is)."""
+    wb = ET.fromstring(z.read('xl/workbook.xml'))
+    sheets = wb.find(_XLSX_NS + 'sheets')
+    view = wb.find(f'{_XLSX_NS}bookViews/{_XLSX_NS}workbookView')
+    tab = int(view.get('activeTab', 0)) if view is not None else 0
+    sheet = sheets[tab] if tab < len(sheets) else sheets[0]
+    rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+    target = next(r.get('Target') for r in rels.iter(_PKG_REL_NS + 'Relationship')
+                  if r.get('Id') == sheet.get(_XLSX_REL_NS + 'id'))
+    # Targets are relative to xl/ unless absolute within the package
+    return target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+def _kv_rows(rows):
+    data = []
+    for a, b in rows:
+        k = str(a).strip() if a else ""
+        v = str(b).strip() if b else ""
+        if k or v: data.append({"key": k, "value": v})
+    return data
+
+def _read_kv_xlsx(path):
+    """Read columns A/B (from row 2) of the active sheet straight from the XLSX XML.
+
+    Raises ValueError for a date cell: converting serials to datetimes is
+    left to openpyxl.
+    """
+    with zipfile.ZipFile(path) as z:
+        shared = []
+        if 'xl/sharedStrings.xml' in z.namelist():
+            with z.open('xl/sharedStrings.xml') as f:
+                for _, si in ET.iterparse(f):
+                    if si.tag == _XLSX_NS + 'si':
+                        shared.append(_xlsx_text(si))
+                        si.clear()
+        date_styles = _xlsx_date_styles(z)
+        rows = []
+        with z.open(_xlsx_active_sheet(z)) as f:
+            row_num = 0
+            for _, row in ET.iterparse(f):
+                if row.tag != _XLSX_NS + 'row': continue
+                row_num = int(row.get('r', row_num + 1))
+                if row_num >= 2:
+                    ab = [None, None]
+                    for i, c in enumerate(row.iter(_XLSX_NS + 'c')):
+                        col = c.get('r', 'AB'[i] if i < 2 else 'C').rstrip('0123456789')
+                        if col not in ('A', 'B'): continue
+                        value = _xlsx_value(c, shared)
+                        if type(value) in (int, float) and int(c.get('s', 0)) in date_styles:
+                            raise ValueError("date cell")
+                        ab[col == 'B'] = value
+                    rows.append(ab)
+                row.clear()
+    return _kv_rows(rows)
 
 def read_excel_file(path):
+    try:
+        return _read_kv_xlsx(path)
+    except Exception:
+        pass # Unusual layout or date cells: let openpyxl handle it
     if not openpyxl: return []
     try:
-        wb = openpyxl.load_workbook(path, data_only=True)
-        ws = wb.active
-        data = []
-        for row in ws.iter_rows(min_row=2):
-            k = str(row[0].value).strip() if row[0].value else ""
-            v = str(row[1].value).strip() if row[1].value else ""
-            if k or v: data.append({"key": k, "value": v})
-        return data
+        # read_only streams rows instead of building the whole sheet model;
+        # the workbook must be closed to release the file handle.
+        wb = openpyxl.load_workbook(path, data_only=True, read_only=True, keep_links=False)
+        try:
+            return _kv_rows(wb.active.iter_rows(min_row=2, max_col=2, values_only=True))
+        finally:
+            wb.close()
     except Exception: return []
 
 def read_desc(folder):
     """Read Excel from Description folder."""
     desc_folder = folder / "Description"
-    if desc_folder.exists():
-        for f in desc_folder.glob("*.xlsx"):
-            if not f.name.startswith('~$'):
-                return read_excel_file(f)
-    return []
+    return _desc_in(desc_folder) if desc_folder.exists() else []
 
-def scan_parts(folder, base):
-    """Recursively scan ModelParts."""
-    parts = []
+def _scan_part(folder, base_str, with_assets):
+    """List one part folder; returns (asset fields, sorted sub-part folders)."""
+    subparts = []
+    assets = {}
+    for name, full, is_dir, _ in _scan(folder):
+        if not is_dir: continue
+        if name in PART_ASSET_FOLDERS: assets[name] = full
+        else: subparts.append((name, full))
+    subparts.sort()
+    if not with_assets: return {}, subparts
     
-    for item in folder.iterdir():
-        if item.is_dir():
-            if item.name in ["Button_Images", "Video", "Description"]: continue
-            
-            part = {
-                "name": item.name,
-                "video": scan_video(item, base),
-                "datasheet": "",
-                "description": read_desc(item),
-                "buttons": scan_images(item, base),
-                "parts": scan_parts(item, base)
-            }
-            parts.append(part)
-    parts.sort(key=lambda x: x['name'])
+    return {
+        "video": _video_in(assets["Video"], base_str) if "Video" in assets else "",
+        "description": _desc_in(assets["Description"]) if "Description" in assets else [],
+        "buttons": _images_in(assets["Button_Images"], base_str) if "Button_Images" in assets else []
+    }, subparts
+
+def walk_parts(root, base):
+    """Scan the ModelParts tree level by level, opening each part folder once.
+
+    All part folders of a level are scanned concurrently on a small thread
+    pool (the work is I/O bound). Each part dict is created in sorted order
+    while its parent is scanned and filled in once its own scan completes.
+    A part whose folder only holds asset folders contributes nothing to the
+    next level, so the walk stops there without another directory open.
+    """
+    base_str = os.path.join(base, '')
+    parts = []
+    level = [(os.fspath(root), None, parts)]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        while level:
+            results = ex.map(lambda item: _scan_part(item[0], base_str, item[1] is not None), level)
+            next_level = []
+            for (_, part, children), (fields, subparts) in zip(level, results):
+                if part is not None: part.update(fields)
+                for name, full in subparts:
+                    child = {
+                        "name": name,
+                        "video": "",
+                        "datasheet": "",
+                        "description": [],
+                        "buttons": [],
+                        "parts": []
+                    }
+                    children.append(child)
+                    next_level.append((full, child, child["parts"]))
+            level = next_level
     return parts
 
+def _emit_items(buf, items, k1, k2):
+    """Append a list of two-string-field dicts (buttons, description rows)."""
+    buf.append('[')
+    for i, item in enumerate(items):
+        if i: buf.append(',')
+        buf.append(f'{{"{k1}":{_q(item[k1])},"{k2}":{_q(item[k2])}}}')
+    buf.append(']')
+
+def _emit_parts(buf, parts):
+    buf.append('[')
+    for i, p in enumerate(parts):
+        if i: buf.append(',')
+        buf.append(f'{{"name":{_q(p["name"])},"video":{_q(p["video"])},'
+                   f'"datasheet":{_q(p["datasheet"])},"description":')
+        _emit_items(buf, p["description"], "key", "value")
+        buf.append(',"buttons":')
+        _emit_items(buf, p["buttons"], "name", "imagePath")
+        buf.append(',"parts":')
+        _emit_parts(buf, p["parts"])
+        buf.append('}')
+    buf.append(']')
+
+def dumps_data(data):
+    """Serialize Data.json content compactly.
+
+    Uses orjson when available; otherwise a writer specialised for the fixed
+    Data.json schema that only escapes string values, producing the same
+    text as json.dumps(data, ensure_ascii=False, separators=(',', ':')).
+    """
+    if orjson: return orjson.dumps(data).decode('utf-8')
+    buf = ['[']
+    for i, d in enumerate(data):
+        if i: buf.append(',')
+        buf.append(f'{{"name":{_q(d["name"])},"qr_image_url":{_q(d["qr_image_url"])},'
+                   f'"modelFileUrl":{_q(d["modelFileUrl"])},"video":{_q(d["video"])},"Description":')
+        _emit_items(buf, d["Description"], "key", "value")
+        buf.append(',"Buttons":')
+        _emit_items(buf, d["Buttons"], "name", "imagePath")
+        buf.append(',"parts":')
+        _emit_parts(buf, d["parts"])
+        buf.append('}')
+    buf.append(']')
+    return ''.join(buf)
+
 def generate_json(folder):
     path = Path(folder).resolve() # Ensure absolute path
     if not path.exists(): 
@@ -205,102 +501,347 @@ def generate_json(folder):
     if not infos.exists():
         print(f"⚠️  ModelInfos not found at {infos}")
     
-    # Model File
-    model_url = ""
-    glb_dir = infos / "3DMODEL"
-    if glb_dir.exists():
-        glbs = list(glb_dir.glob("*.glb"))
-        if glbs: 
-            try:
-                model_url = str(glbs[0].relative_to(path)).replace('\\', '/')
-            except ValueError: pass
-    if not model_url:
-        # Fallback
-        glbs = list(path.glob("*.glb"))
-        if glbs: model_url = glbs[0].name
+    base_str = os.path.join(path, '')
+    try:
+        # Model File
+        model_url = ""
+        glb_dir = infos / "3DMODEL"
+        if glb_dir.exists():
+            glbs = [full for name, full, _, _ in _scan(os.fspath(glb_dir)) if _ext(name) == '.glb']
+            if glbs: model_url = _rel_posix(base_str, glbs[0])
+        if not model_url:
+            # Fallback
+            glbs = [name for name, _, _, is_file in _scan(os.fspath(path)) if is_file and _ext(name) == '.glb']
+            if glbs: model_url = glbs[0]
         
-    # QR Code
-    qr_url = "QRCode.png"
-    qr_dir = infos / "QRCode"
-    if qr_dir.exists():
-        imgs = [f for f in qr_dir.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS]
-        if imgs: 
-            try:
-                qr_url = str(imgs[0].relative_to(path)).replace('\\', '/')
-            except ValueError: pass
+        # QR Code
+        qr_url = "QRCode.png"
+        qr_dir = infos / "QRCode"
+        if qr_dir.exists():
+            imgs = [full for name, full, _, _ in _scan(os.fspath(qr_dir)) if _ext(name) in IMAGE_EXTENSIONS]
+            if imgs: qr_url = _rel_posix(base_str, imgs[0])
         
-    data = [{
-        "name": path.name,
-        "qr_image_url": qr_url,
-        "modelFileUrl": model_url,
-        "video": scan_video(infos, path),
-        "Description": read_desc(infos),
-        "Buttons": scan_images(infos, path),
-        "parts": scan_parts(parts_dir, path) if parts_dir.exists() else []
-    }]
+        data = [{
+            "name": path.name,
+            "qr_image_url": qr_url,
+            "modelFileUrl": model_url,
+            "video": scan_video(infos, path),
+            "Description": read_desc(infos),
+            "Buttons": scan_images(infos, path),
+            "parts": walk_parts(parts_dir, path) if parts_dir.exists() else []
+        }]
+    finally:
+        # Listings are only valid for this run
+        _scan.cache_clear()
     
     json_path = path / "Data.json"
     try:
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # Write next to the target and rename so readers (and the watcher)
+        # never see a half-written Data.json
+        tmp_path = json_path.with_suffix('.json.tmp')
+        tmp_path.write_text(dumps_data(data), encoding='utf-8')
+        os.replace(tmp_path, json_path)
         print(f"✅ Saved Data.json (Size: {json_path.stat().st_size} bytes)")
     except Exception as e:
         print(f"❌ Error writing Data.json: {e}")
 
+def wait_stable(*paths, interval=0.05, cap=2.0):
+    """Wait until the files' sizes stop changing (e.g. copies have finished).
+
+    Polls every `interval` seconds and returns once two rounds of reads agree,
+    or after `cap` seconds. Files that disappear or cannot be stat'ed are
+    skipped; returns False if none of them can be read any more.
+    """
+    last = None
+    deadline = time.monotonic() + cap
+    while time.monotonic() < deadline:
+        sizes = []
+        for path in paths:
+            try:
+                sizes.append(os.stat(path).st_size)
+            except OSError:
+                sizes.append(None)
+        if all(size is None for size in sizes): return False
+        if sizes == last and 0 not in sizes: return True
+        last = sizes
+        time.sleep(interval)
+    return True
+
+def move_file(src, dst):
+    """Rename src to dst; only copy (shutil.move) across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV: raise
+        shutil.move(os.fspath(src), os.fspath(dst))
+
+def is_project_folder(folder):
+    return (folder / "ModelInfos").exists() or (folder / "Data.json").exists()
+
+def classify(src):
+    """Kind of a changed file (see EXT_KIND), or None if it is not watched.
+
+    Works on the raw path string. Our own Data.json output, hidden/Office
+    lock files and partial downloads are never watched.
+    """
+    name = os.path.basename(src)
+    if name == "Data.json" or name.startswith(_IGNORED_PREFIXES) or name.endswith(_IGNORED_SUFFIXES):
+        return None
+    return EXT_KIND.get(_ext(name))
+
 class Handler(FileSystemEventHandler):
+    # Seconds of quiet before a burst of changes triggers one regeneration
+    DEBOUNCE_DELAY = 0.8
+    
+    def __init__(self, root="."):
+        super().__init__()
+        self.root = Path(root).resolve()
+        self._root_str = str(self.root)
+        self._root_len = len(self._root_str)
+        # Known project folders, kept up to date from events so that finding
+        # the project of a changed file never touches the filesystem
+        # (plain strings: hashing a str is cached, hashing a Path is not)
+        self.projects = {str(self.root)} if is_project_folder(self.root) else set()
+        try:
+            with os.scandir(self.root) as it:
+                for e in it:
+                    if e.is_dir() and is_project_folder(Path(e.path)): self.projects.add(e.path)
+        except OSError as e:
+            log.warning(f"⚠️  Could not list {self.root}: {e}")
+        # One debounce timer per project root, so a burst in one project
+        # never delays (or merges with) another
+        self._timers = {}
+        self._touched = {} # project root -> files changed since its last flush
+        # project root -> {file: (mtime_ns, size)}; only touched by
+        # the worker (one thread per project)
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        # Heavy work is queued to a single worker thread so the watcher
+        # thread only enqueues and keeps delivering events
+        self.queue = queue.Queue()
+        self.worker = threading.Thread(target=self._work, daemon=True)
+        self.worker.start()
+    
     def on_created(self, event):
-        if event.is_directory: return
-        self._process(Path(event.src_path))
+        if event.is_directory:
+            self._created_dir(Path(event.src_path))
+        elif kind := classify(event.src_path):
+            self._process(event.src_path, kind)
         
     def on_modified(self, event):
         if event.is_directory: return
-        self._process(Path(event.src_path))
+        if kind := classify(event.src_path):
+            self._process(event.src_path, kind)
+
+    def dispatch_change(self, change, src):
+        """Route one watchfiles (change, path) pair to the handlers above."""
+        if change == watchfiles.Change.deleted:
+            # The path is gone, so we cannot tell if it was a directory;
+            # handling it as both is harmless
+            self._deleted_dir(Path(src))
+            self._removed(src)
+        elif kind := classify(src):
+            self._process(src, kind)
+        elif change == watchfiles.Change.added and os.path.isdir(src):
+            # watchfiles reports a folder moved in as one added path, with
+            # no events for its contents: register it if it is a project
+            path = Path(src)
+            if path.name == "ModelInfos": self._created_dir(path)
+            elif is_project_folder(path): self.projects.add(src)
 
-    def _process(self, path):
-        path = path.resolve()
+    def _created_dir(self, path):
+        # A project folder copied in: its ModelInfos appears
+        if path.name == "ModelInfos": self.projects.add(str(path.parent))
+
+    def _process(self, src, kind):
+        # Works on the raw path string; a Path is only built for a new GLB
+        name = os.path.basename(src)
+        folder = os.path.dirname(src)
         
         # 1. New GLB detection
-        if path.suffix.lower() == '.glb':
-            is_in_structure = "3DMODEL" in [p.name for p in path.parents]
-            if not is_in_structure:
-                print(f"🆕 New GLB detected: {path.name}")
-                time.sleep(1) 
-                create_structure(path)
+        if kind == 'model':
+            if "3DMODEL" not in folder.split(os.sep):
+                log.info(f"🆕 New GLB detected: {name}")
+                self.queue.put(("create", Path(src)))
                 return
 
         # 2. Batch file auto-moving
-        if path.suffix.lower() == '.bat':
+        if kind == 'script':
             # If a .bat is dropped at root, move it to the first available project folder
-            root_dir = Path(".").resolve()
-            if path.parent == root_dir:
-                # Find project folders
-                for p in root_dir.iterdir():
-                    if p.is_dir() and ((p / "ModelInfos").exists() or (p / "Data.json").exists()):
-                        print(f"📦 Moving script {path.name} to project folder: {p.name}")
-                        try:
-                            # Wait a bit for file to be ready
-                            time.sleep(0.5)
-                            dest = p / path.name
-                            shutil.move(str(path), str(dest))
-                            return # Only move to the first one found
-                        except Exception as e:
-                            print(f"❌ Error moving .bat: {e}")
-
-        # 3. Existing project updates
-        if path.suffix.lower() in IMAGE_EXTENSIONS | VIDEO_EXTENSIONS | {'.xlsx', '.glb'}:
-            p = path.parent
-            for _ in range(5):
-                if len(p.parts) < 2: break
-                if (p / "ModelInfos").exists() or (p / "Data.json").exists():
-                    if path.name == "Data.json": return 
-                    print(f"📝 Change in {path.name} -> Updating directory: {p.name}")
-                    try:
-                        time.sleep(1) 
-                        generate_json(p)
-                    except Exception as e:
-                        print(f"❌ Error regenerating: {e}")
-                    break
-                p = p.parent
+            if folder == self._root_str:
+                # Waiting for the copy and moving happen on the worker
+                self.queue.put(("move", src))
+            return
+
+        # 3. Existing project updates (images, videos, .xlsx, placed .glb)
+        p = self.find_project(src)
+        if p:
+            log.info(f"📝 Change in {name} -> Updating directory: {p.name}")
+            self._schedule(p, src)
+
+    def on_deleted(self, event):
+        if event.is_directory: self._deleted_dir(Path(event.src_path))
+        else: self._removed(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            self._deleted_dir(Path(event.src_path))
+            dest = Path(event.dest_path)
+            if dest.name == "ModelInfos": self._created_dir(dest)
+            elif is_project_folder(dest): self.projects.add(str(dest))
+            return
+        # A rename (e.g. an editor saving via a temp file) refreshes the old and
+        # new projects through their debounce timers, once each
+        self._removed(event.src_path)
+        if kind := classify(event.dest_path):
+            self._process(event.dest_path, kind)
+
+    def _removed(self, src):
+        """A watched file left its folder: refresh the project it was in."""
+        if classify(src) in (None, 'script'): return
+        if p := self.find_project(src): self._schedule(p, src)
+
+    def _deleted_dir(self, path):
+        root = path.parent if path.name == "ModelInfos" else path
+        self.projects.discard(str(root))
+        # Drop a regeneration already pending for the removed project
+        with self._lock:
+            timer = self._timers.pop(root, None)
+            if timer: timer.cancel()
+            self._touched.pop(root, None)
+
+    def find_project(self, path):
+        """Nearest known project folder among the parents of path, up to the root.
+
+        Event paths are absolute and under self.root (see watch()), so string
+        prefixes are enough and the walk ends at the root's length. Projects
+        nested deeper than the root's children are not known up front: on a
+        miss, the nearest 5 parents are checked on disk and a project found
+        there is remembered.
+        """
+        start = p = os.path.dirname(os.fspath(path))
+        while len(p) >= self._root_len:
+            if p in self.projects: return Path(p)
+            parent = os.path.dirname(p)
+            if parent == p: break
+            p = parent
+        p = start
+        for _ in range(5):
+            if len(p) < self._root_len: break
+            if is_project_folder(Path(p)):
+                self.projects.add(p)
+                return Path(p)
+            parent = os.path.dirname(p)
+            if parent == p: break
+            p = parent
+        return None
+
+    def _schedule(self, root, path):
+        """Queue a project for regeneration, restarting its debounce timer."""
+        with self._lock:
+            self._touched.setdefault(root, set()).add(path)
+            timer = self._timers.get(root)
+            if timer: timer.cancel()
+            timer = self._timers[root] = threading.Timer(self.DEBOUNCE_DELAY, self._flush, args=[root])
+            timer.daemon = True
+            timer.start()
+
+    def _flush(self, root):
+        with self._lock:
+            # A timer restarted too late to be cancelled: the newer one flushes
+            if self._timers.get(root) is not threading.current_thread(): return
+            del self._timers[root]
+            touched = self._touched.pop(root, set())
+        self.queue.put(("regen", root, touched))
+
+    def stop(self):
+        """Let the worker finish queued tasks, then end it."""
+        self.queue.put(None)
+        self.worker.join()
+
+    def _work(self):
+        while True:
+            task = self.queue.get()
+            # Drain whatever else is waiting: GLBs are created in order, and
+            # repeated moves/creates of one file (watchdog reports a drop as
+            # created + modified) and regenerations of one project are merged
+            tasks = [task]
+            while True:
+                try: tasks.append(self.queue.get_nowait())
+                except queue.Empty: break
+            moves = list(dict.fromkeys(t[1] for t in tasks if t and t[0] == "move"))
+            creates = list(dict.fromkeys(t[1] for t in tasks if t and t[0] == "create"))
+            dirty = {}
+            for t in tasks:
+                if t and t[0] == "regen": dirty.setdefault(t[1], set()).update(t[2])
+            for src in moves:
+                self._move_script(src)
+            for glb_path in creates:
+                self._run(self._create, glb_path)
+            if len(dirty) > 1:
+                # Projects live in disjoint folders, so they regenerate in parallel
+                with ThreadPoolExecutor(max_workers=min(8, len(dirty))) as ex:
+                    list(ex.map(lambda item: self._run(self._regen, item), dirty.items()))
+            else:
+                # A failing task is logged by _run and never ends the worker
+                for item in dirty.items(): self._run(self._regen, item)
+            if None in tasks: return
+
+    def _regen(self, item):
+        root, touched = item
+        # The project was deleted after its regeneration was queued
+        if not root.is_dir(): return
+        # One settle-wait per flush for all files touched in the burst
+        wait_stable(*touched)
+        if self._unchanged(root, touched): return
+        self._run(generate_json, root)
+
+    def _unchanged(self, root, touched):
+        """True if every touched file has the same mtime and size as when it
+        last triggered a regeneration (e.g. an editor re-saving same bytes)."""
+        seen = self._fingerprints.setdefault(root, {})
+        changed = False
+        for f in touched:
+            try:
+                st = os.stat(f)
+            except OSError:
+                # Gone or unreadable: always regenerate
+                seen.pop(f, None)
+                changed = True
+                continue
+            fp = (st.st_mtime_ns, st.st_size)
+            if seen.get(f) != fp:
+                seen[f] = fp
+                changed = True
+        return not changed
+
+    def _move_script(self, src):
+        """Move a .bat dropped at the root into the first project folder."""
+        # Already moved by an earlier task for the same drop
+        if not os.path.exists(src): return
+        name = os.path.basename(src)
+        # Project folders directly under the root, from a snapshot of the
+        # known set (the watcher thread may add to it meanwhile)
+        for p in sorted(Path(p) for p in list(self.projects) if os.path.dirname(p) == self._root_str):
+            log.info(f"📦 Moving script {name} to project folder: {p.name}")
+            try:
+                # Wait for the file to be fully copied
+                wait_stable(src)
+                move_file(src, p / name)
+                return # Only move to the first one found
+            except Exception as e:
+                log.error(f"❌ Error moving .bat: {e}")
+
+    def _create(self, glb_path):
+        wait_stable(glb_path)
+        create_structure(glb_path)
+        self.projects.add(str(glb_path.parent / glb_path.stem))
+
+    def _run(self, fn, arg):
+        try:
+            fn(arg)
+        except Exception as e:
+            log.error(f"❌ Error regenerating: {e}")
 
 def create_structure(glb_path):
     glb = Path(glb_path)
@@ -327,7 +868,7 @@ def create_structure(glb_path):
     # Move GLB
     dest_glb = infos / "3DMODEL" / glb.name
     try:
-        shutil.move(str(glb), str(dest_glb))
+        move_file(glb, dest_glb)
     except Exception as e:
         print(f"❌ Error moving GLB to final location: {e}")
     
@@ -341,15 +882,43 @@ def create_structure(glb_path):
     generate_json(root)
 
 def watch(folder):
-    obs = Observer()
-    obs.schedule(Handler(), str(folder), recursive=True)
-    obs.start()
-    print(f"👀 Watching {folder} for changes...")
-    try:
-        while True: time.sleep(1)
-    except KeyboardInterrupt:
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    
+    handler = Handler(folder)
+    # Watch the resolved root so every event path is already absolute and
+    # canonical; the handler never needs to resolve() per event
+    root = handler.root
+    if watchfiles:
+        # Rust-backed watcher: delivers each burst as one deduplicated batch
+        log.info(f"👀 Watching {folder} for changes...")
+        try:
+            for changes in watchfiles.watch(root, debounce=200, step=100):
+                for change, src in changes: handler.dispatch_change(change, src)
+        except KeyboardInterrupt:
+            pass
+    elif Observer:
+        obs = Observer()
+        obs.schedule(handler, str(root), recursive=True)
+        obs.start()
+        log.info(f"👀 Watching {folder} for changes...")
+        # Block until Ctrl-C instead of waking up every second. Windows cannot
+        # interrupt an untimed wait, so there it still wakes up periodically.
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        while not stop.wait(1 if os.name == 'nt' else None): pass
         obs.stop()
-    obs.join()
+        obs.join()
+    else:
+        log.error("❌ Watching requires watchfiles or watchdog (pip install watchfiles)")
+    handler.stop()
+    listener.stop()
 
 if __name__ == "__main__":
     if len(sys.argv) > 1: